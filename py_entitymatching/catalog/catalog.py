@@ -1,8 +1,14 @@
 # coding=utf-8
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# Sentinels returned by Catalog.try_get_property, to tell apart a missing
+# DataFrame entry from a missing property without probing the catalog twice.
+DF_NOT_PRESENT = object()
+PROPERTY_NOT_PRESENT = object()
+
 
 class Singleton(object):
     """
@@ -46,9 +52,26 @@ class Catalog(object):
     """
     Class to store and retrieve catalog information
     """
+    __slots__ = ('properties_catalog', '_finalizers')
 
     def __init__(self):
         self.properties_catalog = {}
+        self._finalizers = {}
+
+    def _track(self, df):
+        # The catalog is keyed by id(df), so remove the entry once the
+        # DataFrame is garbage collected. Otherwise the entry leaks, and a new
+        # object that reuses the id would pick up stale properties.
+        df_id = id(df)
+        finalizer = self._finalizers.get(df_id)
+        if finalizer is None or not finalizer.alive:
+            finalizer = weakref.finalize(df, self._forget, df_id)
+            finalizer.atexit = False
+            self._finalizers[df_id] = finalizer
+
+    def _forget(self, obj_id):
+        self.properties_catalog.pop(obj_id, None)
+        self._finalizers.pop(obj_id, None)
 
     def init_properties_for_id(self, obj_id):
         self.properties_catalog[obj_id] = {}
@@ -56,6 +79,7 @@ class Catalog(object):
 
     def init_properties(self, df):
         df_id = id(df)
+        self._track(df)
         self.init_properties_for_id(df_id)
 
     def get_property_for_id(self, obj_id, name):
@@ -76,6 +100,34 @@ class Catalog(object):
         df_id = id(df)
         return self.set_property_for_id(df_id, name, value)
 
+    def set_properties_for_id(self, obj_id, properties):
+        self.properties_catalog[obj_id] = dict(properties)
+        return True
+
+    def set_properties(self, df, properties):
+        df_id = id(df)
+        self._track(df)
+        return self.set_properties_for_id(df_id, properties)
+
+    def _get_or_init_properties(self, df):
+        # Initialize the properties for the DataFrame only if they are not
+        # present, so that the common case is a single lookup.
+        d = self.properties_catalog.get(id(df))
+        if d is None:
+            self.init_properties(df)
+            d = self.properties_catalog[id(df)]
+        return d
+
+    def set_property_or_init(self, df, name, value):
+        d = self._get_or_init_properties(df)
+        d[name] = value
+        return True
+
+    def update_properties(self, df, properties):
+        d = self._get_or_init_properties(df)
+        d.update(properties)
+        return True
+
     def get_all_properties_for_id(self, obj_id):
         d = self.properties_catalog[obj_id]
         return d
@@ -125,3 +177,12 @@ class Catalog(object):
     def is_property_present_for_df(self, df, name):
         df_id = id(df)
         return self.is_property_present_for_id(df_id, name)
+
+    def try_get_property(self, df, name):
+        d = self.properties_catalog.get(id(df))
+        if d is None:
+            return DF_NOT_PRESENT
+        return d.get(name, PROPERTY_NOT_PRESENT)
+
+    def try_get_all_properties(self, df):
+        return self.properties_catalog.get(id(df), DF_NOT_PRESENT)
@@ -5,14 +5,21 @@ This module contains wrapper functions for the catalog.
 import logging
 
 import pandas as pd
-import six
 
 import py_entitymatching.utils.catalog_helper as ch
-from py_entitymatching.catalog.catalog import Catalog
+from py_entitymatching.catalog.catalog import Catalog, DF_NOT_PRESENT, \
+    PROPERTY_NOT_PRESENT
 from py_entitymatching.utils.validation_helper import validate_object_type
 
 logger = logging.getLogger(__name__)
 
+# The catalog is a singleton, so fetch the instance once at import time
+# instead of going through Catalog.Instance() on every call.
+_catalog = Catalog.Instance()
+
+# Bind the DataFrame type once, the type checks below run on every call.
+_DF = pd.DataFrame
+
 
 def get_property(data_frame, property_name):
     """
@@ -48,32 +55,66 @@ def get_property(data_frame, property_name):
     # Validate input parameters
 
     # # The input object should be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # # The property name should be of type string
-    validate_object_type(property_name, six.string_types, error_prefix='Property name')
+    validate_object_type(property_name, str, error_prefix='Property name')
+
+    # Get the requested property for the input DataFrame
+    return _get_property_unchecked(data_frame, property_name)
+
+
+def _get_property_unchecked(data_frame, property_name):
+    """
+    Gets the value of a property for a DataFrame from the catalog, without
+    validating the input parameters.
 
-    # Get the catalog instance, this is imported here because this object
-    # used to validate the presence of a DataFrame in the catalog, and the
-    # presence of requested metadata in the catalog.
-    catalog = Catalog.Instance()
+    This is used by get_property once the inputs are validated, and by the
+    sugar functions (such as get_key) that pass a literal property name.
+    """
+    # Look up the DataFrame entry and the requested property in one go.
+    property_value = _catalog.try_get_property(data_frame, property_name)
 
     # Check for the present of input DataFrame in the catalog.
-    if not catalog.is_df_info_present_in_catalog(data_frame):
+    if property_value is DF_NOT_PRESENT:
         logger.error('DataFrame information is not present in the catalog')
         raise KeyError('DataFrame information is not present in the catalog')
 
     # Check if the requested property is present in the catalog.
-    if not catalog.is_property_present_for_df(data_frame, property_name):
-        logger.error(
-            'Requested metadata ( %s ) for the given DataFrame is not '
-            'present in the catalog' % property_name)
-        raise KeyError(
-            'Requested metadata ( %s ) for the given DataFrame is not '
-            'present in the catalog' % property_name)
+    if property_value is PROPERTY_NOT_PRESENT:
+        error_message = ('Requested metadata ( %s ) for the given DataFrame '
+                         'is not present in the catalog' % property_name)
+        logger.error(error_message)
+        raise KeyError(error_message)
 
     # Return the requested property for the input DataFrame
-    return catalog.get_property(data_frame, property_name)
+    return property_value
+
+
+def _get_properties_unchecked(data_frame, property_names):
+    """
+    Gets the values of several properties for a DataFrame from the catalog,
+    looking up the DataFrame entry only once. The input parameters are not
+    validated.
+    """
+    properties = _catalog.try_get_all_properties(data_frame)
+
+    # Check for the present of input DataFrame in the catalog.
+    if properties is DF_NOT_PRESENT:
+        logger.error('DataFrame information is not present in the catalog')
+        raise KeyError('DataFrame information is not present in the catalog')
+
+    # Get the requested properties, in the given order.
+    property_values = []
+    for property_name in property_names:
+        property_value = properties.get(property_name, PROPERTY_NOT_PRESENT)
+        if property_value is PROPERTY_NOT_PRESENT:
+            error_message = ('Requested metadata ( %s ) for the given DataFrame '
+                             'is not present in the catalog' % property_name)
+            logger.error(error_message)
+            raise KeyError(error_message)
+        property_values.append(property_value)
+    return property_values
 
 
 def set_property(data_frame, property_name, property_value):
@@ -116,24 +157,33 @@ def set_property(data_frame, property_name, property_value):
     # Validate input parameters
 
     # # The input object should be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # # The property name should be of type string
-    validate_object_type(property_name, six.string_types, error_prefix='Property name')
+    validate_object_type(property_name, str, error_prefix='Property name')
 
     # Get the catalog instance
-    catalog = Catalog.Instance()
-
-    # Check if the DataFrame information is present in the catalog. If the
-    # information is not present, then initialize an entry for that DataFrame
-    #  in the catalog.
-    if not catalog.is_df_info_present_in_catalog(data_frame):
-        catalog.init_properties(data_frame)
+    catalog = _catalog
 
     # Set the property in the catalog, and relay the return value from the
-    # underlying catalog object's function. The return value is typically
-    # True if the update was successful.
-    return catalog.set_property(data_frame, property_name, property_value)
+    # underlying catalog object's function. If the DataFrame information is
+    # not present in the catalog, an entry is initialized for it first. The
+    # return value is typically True if the update was successful.
+    return catalog.set_property_or_init(data_frame, property_name,
+                                        property_value)
+
+
+def _set_property_unchecked(data_frame, property_name, property_value):
+    """
+    Sets the value of a property for a DataFrame in the catalog, without
+    validating the input parameters.
+
+    This is used by the functions in this module that have already validated
+    the DataFrame and the property value (such as set_key), and pass a
+    literal property name.
+    """
+    return _catalog.set_property_or_init(data_frame, property_name,
+                                         property_value)
 
 
 def init_properties(data_frame):
@@ -155,10 +205,10 @@ def init_properties(data_frame):
     # Validate input parameters
 
     # # The input object should be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
 
     # Initialize the property in the catalog.
     # Relay the return value from the underlying catalog object's function.
@@ -187,10 +237,10 @@ def get_all_properties(data_frame):
     # Validate input parameters
     # # The input object is expected to be of type DataFrame
     # # The input object should be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
 
     # Check if the DataFrame information is present in the catalog. If not
     # raise an error.
@@ -238,27 +288,30 @@ def del_property(data_frame, property_name):
     # Validate input parameters
 
     # # The input object should be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # # The property name should be of type string
-    validate_object_type(property_name, six.string_types, error_prefix='Property name')
+    validate_object_type(property_name, str, error_prefix='Property name')
 
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
+
+    # Look up the DataFrame entry and the property to be deleted in one go.
+    property_value = catalog.try_get_property(data_frame, property_name)
 
     # Check if the DataFrame information is present in the catalog, if not
     # raise an error.
-    if not catalog.is_df_info_present_in_catalog(data_frame):
+    if property_value is DF_NOT_PRESENT:
         logger.error('DataFrame information is not present in the catalog')
         raise KeyError('DataFrame information is not present in the catalog')
 
     # Check if the requested property name to be deleted  is present for the
     # DataFrame in the catalog, if not raise an error.
-    if not catalog.is_property_present_for_df(data_frame, property_name):
-        logger.error('Requested metadata ( %s ) for the given DataFrame is '
-                     'not present in the catalog' %property_name)
-        raise KeyError('Requested metadata ( %s ) for the given DataFrame is '
-                       'not present in the catalog' %property_name)
+    if property_value is PROPERTY_NOT_PRESENT:
+        error_message = ('Requested metadata ( %s ) for the given DataFrame '
+                         'is not present in the catalog' % property_name)
+        logger.error(error_message)
+        raise KeyError(error_message)
 
     # Delete the property using the underlying catalog object and relay the
     # return value. Typically the return value is True if the deletion was
@@ -291,12 +344,12 @@ def del_all_properties(data_frame):
     """
     # Validations of input parameters
     # # The input object is expected to be of type pandas DataFrame
-    if not isinstance(data_frame, pd.DataFrame):
+    if not isinstance(data_frame, _DF):
         logger.error('Input object is not of type pandas data frame')
         raise AssertionError('Input object is not of type pandas data frame')
 
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
 
     # Check if the DataFrame is present in the catalog. If not, raise an error
     if not catalog.is_df_info_present_in_catalog(data_frame):
@@ -325,7 +378,7 @@ def get_catalog():
 
     """
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
     # Call the underlying catalog object's function to get the catalog. Relay
     # the return value from the delegated function.
     return catalog.get_catalog()
@@ -343,7 +396,7 @@ def del_catalog():
         >>> em.del_catalog()
     """
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
     # Call the underlying catalog object's function to delete the catalog (a
     # dict).  Relay the return value from the delegated function.
     return catalog.del_catalog()
@@ -367,7 +420,7 @@ def is_catalog_empty():
 
     """
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
 
     # Call the underlying catalog object's function to check if the catalog
     # is empty.  Relay the return value from the delegated function.
@@ -401,10 +454,10 @@ def is_dfinfo_present(data_frame):
     """
     # Validate inputs
     # We expect the input object to be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
 
     # Call the underlying catalog object's function to check if the
     # DataFrame information is present in the catalog.
@@ -448,24 +501,26 @@ def is_property_present_for_df(data_frame, property_name):
     # Input validations
 
     # # The input object should be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # # The property name should be of type string
-    validate_object_type(property_name, six.string_types, error_prefix='Property name')
+    validate_object_type(property_name, str, error_prefix='Property name')
 
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
+
+    # Look up the DataFrame entry and the property in one go.
+    property_value = catalog.try_get_property(data_frame, property_name)
 
     # Check if the given DataFrame information is present in the catalog. If
     # not, raise an error.
-    if catalog.is_df_info_present_in_catalog(data_frame) is False:
+    if property_value is DF_NOT_PRESENT:
         logger.error('DataFrame information is not present in the catalog')
         raise KeyError('DataFrame information is not present in the catalog')
 
-    # Call the underlying catalog object's function to check if the property
-    # is present for the given DataFrame. Relay the return value from that
-    # function.
-    return catalog.is_property_present_for_df(data_frame, property_name)
+    # The property is present for the given DataFrame if the lookup did not
+    # return the missing property sentinel.
+    return property_value is not PROPERTY_NOT_PRESENT
 
 
 def get_catalog_len():
@@ -481,7 +536,7 @@ def get_catalog_len():
 
     """
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
     # Call the underlying catalog object's function to get the catalog length.
     # Relay the return value from that function.
     return catalog.get_catalog_len()
@@ -519,39 +574,28 @@ def set_properties(data_frame, properties, replace=True):
     """
     # Validate input parameters
     # # Input object is expected to be a pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # # Input properties is expected to be of type Python dictionary
     validate_object_type(properties, dict, error_prefix='The properties')
 
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
     # Check if the the DataFrame information is present in the catalog. If
     # present, we expect the replace flag to be True. If the flag was set to
     # False, then warn the user and return False.
-    if catalog.is_df_info_present_in_catalog(data_frame):
-        if not replace:
-            logger.warning(
-                'Properties already exists for df ( %s ). Not replacing it'
-                %str(id(data_frame)))
-            return False
-        else:
-            # DataFrame information is present and replace flag is True. We
-            # now reset the properties dictionary for this DataFrame.
-            catalog.init_properties(data_frame)
-    else:
-        # The DataFrame information is not present in the catalog. so
-        # initialize the properties
-        catalog.init_properties(data_frame)
+    if not replace and catalog.is_df_info_present_in_catalog(data_frame):
+        logger.warning(
+            'Properties already exists for df ( %s ). Not replacing it'
+            %str(id(data_frame)))
+        return False
 
-    # Now iterate through the given properties and set for the DataFrame.
+    # Either the DataFrame information is not present in the catalog or the
+    # replace flag is True. In both cases, the properties dictionary for this
+    # DataFrame is (re)set with the given properties in one update.
     # Note: Here we don't check the correctness of the input properties (i.e
     # we do not check if a property 'key' is indeed a key)
-    for property_name, property_value in six.iteritems(properties):
-        catalog.set_property(data_frame, property_name, property_value)
-
-    # Finally return True, if everything was successful
-    return True
+    return catalog.set_properties(data_frame, properties)
 
 
 def copy_properties(source_data_frame, target_data_frame, replace=True):
@@ -601,13 +645,13 @@ def copy_properties(source_data_frame, target_data_frame, replace=True):
     # Validate input parameters
 
     # # The source_data_frame is expected to be of type pandas DataFrame
-    validate_object_type(source_data_frame, pd.DataFrame, error_prefix='Input object (source_data_frame)')
+    validate_object_type(source_data_frame, _DF, error_prefix='Input object (source_data_frame)')
 
     # # The target_data_frame is expected to be of type pandas DataFrame
-    validate_object_type(target_data_frame, pd.DataFrame, error_prefix='Input object (target_data_frame)')
+    validate_object_type(target_data_frame, _DF, error_prefix='Input object (target_data_frame)')
 
     # Get the catalog instance
-    catalog = Catalog.Instance()
+    catalog = _catalog
 
     # Check if the source DataFrame information is present in the catalog. If
     #  not raise an error.
@@ -657,8 +701,10 @@ def get_key(data_frame):
         :meth:`~py_entitymatching.get_property`
 
     """
-    # This function is just a sugar to get the 'key' property for a DataFrame
-    return get_property(data_frame, 'key')
+    # This function is just a sugar to get the 'key' property. The property
+    # name is a literal, so only the DataFrame needs to be validated.
+    validate_object_type(data_frame, _DF)
+    return _get_property_unchecked(data_frame, 'key')
 
 
 def set_key(data_frame, key_attribute):
@@ -707,16 +753,17 @@ def set_key(data_frame, key_attribute):
     # Validate input parameters
 
     # # We expect the input object (data_frame) to be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # # We expect input key attribute to be of type string
-    validate_object_type(key_attribute, six.string_types, error_prefix='Input key attribute')
+    validate_object_type(key_attribute, str, error_prefix='Input key attribute')
 
     # Check if the key attribute is present as one of the columns in the
     # DataFrame
     if not ch.check_attrs_present(data_frame, key_attribute):
-        logger.error('Input key ( %s ) not in the DataFrame' % key_attribute)
-        raise KeyError('Input key ( %s ) not in the DataFrame' % key_attribute)
+        error_message = 'Input key ( %s ) not in the DataFrame' % key_attribute
+        logger.error(error_message)
+        raise KeyError(error_message)
 
     # Check if the key attribute satisfies the conditions to be a key. If
     # not, just return False.
@@ -734,7 +781,7 @@ def set_key(data_frame, key_attribute):
         return False
     else:
         # Set the key property for the input DataFrame
-        return set_property(data_frame, 'key', key_attribute)
+        return _set_property_unchecked(data_frame, 'key', key_attribute)
 
 
 def get_fk_ltable(data_frame):
@@ -772,8 +819,10 @@ def get_fk_ltable(data_frame):
         :meth:`~py_entitymatching.get_property`
 
     """
-    # Call the get_property function and relay the result.
-    return get_property(data_frame, 'fk_ltable')
+    # This function is just a sugar to get the 'fk_ltable' property. The property
+    # name is a literal, so only the DataFrame needs to be validated.
+    validate_object_type(data_frame, _DF)
+    return _get_property_unchecked(data_frame, 'fk_ltable')
 
 
 def get_fk_rtable(data_frame):
@@ -808,8 +857,10 @@ def get_fk_rtable(data_frame):
     See Also:
         :meth:`~py_entitymatching.get_property`
     """
-    # Call the get_property function and relay the result.
-    return get_property(data_frame, 'fk_rtable')
+    # This function is just a sugar to get the 'fk_rtable' property. The property
+    # name is a literal, so only the DataFrame needs to be validated.
+    validate_object_type(data_frame, _DF)
+    return _get_property_unchecked(data_frame, 'fk_rtable')
 
 
 def set_fk_ltable(data_frame, fk_ltable):
@@ -859,19 +910,20 @@ def set_fk_ltable(data_frame, fk_ltable):
     """
     # Validate the input parameters
     # # We expect the input object to be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
     # # We expect the input fk_ltable to be of type string
-    validate_object_type(fk_ltable, six.string_types, error_prefix='The input (fk_ltable)')
+    validate_object_type(fk_ltable, str, error_prefix='The input (fk_ltable)')
 
     # # The fk_ltable attribute should be one of the columns in the input
     # DataFrame
     if not ch.check_attrs_present(data_frame, fk_ltable):
-        logger.error('Input attr. ( %s ) not in the DataFrame' % fk_ltable)
-        raise KeyError('Input attr. ( %s ) not in the DataFrame' % fk_ltable)
+        error_message = 'Input attr. ( %s ) not in the DataFrame' % fk_ltable
+        logger.error(error_message)
+        raise KeyError(error_message)
 
-    # Call the set_property function and relay the result.
-    return set_property(data_frame, 'fk_ltable', fk_ltable)
+    # The inputs are validated, so set the property and relay the result.
+    return _set_property_unchecked(data_frame, 'fk_ltable', fk_ltable)
 
 
 def validate_and_set_fk_ltable(foreign_data_frame, foreign_key_ltable, ltable,
@@ -918,7 +970,8 @@ def validate_and_set_fk_ltable(foreign_data_frame, foreign_key_ltable, ltable,
 
     # If the validation is successful then set the property
     if status:
-        return set_property(foreign_data_frame, 'fk_ltable', foreign_key_ltable)
+        return _set_property_unchecked(foreign_data_frame, 'fk_ltable',
+                                       foreign_key_ltable)
     else:
         # else report the error and just return False.
         logger.warning(
@@ -971,7 +1024,8 @@ def validate_and_set_fk_rtable(foreign_data_frame, foreign_key_rtable,
 
     # If the validation was successful, then set the property
     if status:
-        return set_property(foreign_data_frame, 'fk_rtable', foreign_key_rtable)
+        return _set_property_unchecked(foreign_data_frame, 'fk_rtable',
+                                       foreign_key_rtable)
     # else just warn and return False
     else:
         logger.warning(
@@ -1028,19 +1082,19 @@ def set_fk_rtable(data_frame, foreign_key_rtable):
     """
     # Validate the input parameters
     # # The input object is expected to be of type pandas DataFrame
-    validate_object_type(data_frame, pd.DataFrame)
+    validate_object_type(data_frame, _DF)
 
-    validate_object_type(foreign_key_rtable, six.string_types, error_prefix='Input (foreign key ltable)')
+    validate_object_type(foreign_key_rtable, str, error_prefix='Input (foreign key ltable)')
 
     # Check if the given attribute is present in the DataFrame
     if not ch.check_attrs_present(data_frame, foreign_key_rtable):
-        logger.error('Input attr. ( %s ) not in the DataFrame'
-                     % foreign_key_rtable)
-        raise KeyError('Input attr. ( %s ) not in the DataFrame'
-                       % foreign_key_rtable)
+        error_message = ('Input attr. ( %s ) not in the DataFrame'
+                         % foreign_key_rtable)
+        logger.error(error_message)
+        raise KeyError(error_message)
 
     # Finally set the property and relay the result
-    return set_property(data_frame, 'fk_rtable', foreign_key_rtable)
+    return _set_property_unchecked(data_frame, 'fk_rtable', foreign_key_rtable)
 
 
 def show_properties(data_frame):
@@ -1075,9 +1129,9 @@ def show_properties(data_frame):
     # # First print the id for the DataFrame
     # print('id: ' + str(id(data_frame)))
     # # For each property name anf value, print the contents to the user
-    # for property_name, property_value in six.iteritems(metadata):
+    # for property_name, property_value in metadata.items():
     #     # If the property value is string print it out
-    #     if isinstance(property_value, six.string_types):
+    #     if isinstance(property_value, str):
     #         print(property_name + ": " + property_value)
     #     # else, print just the id.
     #     else:
@@ -1105,18 +1159,19 @@ def show_properties_for_id(object_id):
 
 
     """
-    catalog = Catalog.Instance()
+    catalog = _catalog
     metadata = catalog.get_all_properties_for_id(object_id)
-    # First print the id for the DataFrame
-    print('id: ' + str(object_id))
-    # For each property name anf value, print the contents to the user
-    for property_name, property_value in six.iteritems(metadata):
-        # If the property value is string print it out
-        if isinstance(property_value, six.string_types):
-            print(property_name + ": " + property_value)
-        # else, print just the id.
+    # Collect the lines and print them at once. First the id for the DataFrame
+    lines = ['id: ' + str(object_id)]
+    # For each property name anf value, add the contents to be shown
+    for property_name, property_value in metadata.items():
+        # If the property value is string show it as is
+        if isinstance(property_value, str):
+            lines.append(property_name + ": " + property_value)
+        # else, show just the id.
         else:
-            print(property_name + "(obj.id): " + str(id(property_value)))
+            lines.append(property_name + "(obj.id): " + str(id(property_value)))
+    print('\n'.join(lines))
 
 
 def set_candset_properties(candset, key, foreign_key_ltable,
@@ -1147,15 +1202,32 @@ def set_candset_properties(candset, key, foreign_key_ltable,
         A Boolean value of True is returned if the updates were successful.
 
     """
-    # set the key
-    set_property(candset, 'key', key)
-    # set the foreign key attributes
-    set_fk_ltable(candset, foreign_key_ltable)
-    set_fk_rtable(candset, foreign_key_rtable)
-    # set the ltable and rtables
-    set_property(candset, 'ltable', ltable)
-    set_property(candset, 'rtable', rtable)
-    return True
+    # Validate the input parameters
+    # # We expect the input candset to be of type pandas DataFrame
+    validate_object_type(candset, _DF)
+
+    # # We expect the foreign keys to be of type string
+    validate_object_type(foreign_key_ltable, str,
+                         error_prefix='The input (fk_ltable)')
+    validate_object_type(foreign_key_rtable, str,
+                         error_prefix='The input (fk_rtable)')
+
+    # # The foreign key attributes should be columns in the candset
+    for foreign_key in (foreign_key_ltable, foreign_key_rtable):
+        if not ch.check_attrs_present(candset, foreign_key):
+            error_message = ('Input attr. ( %s ) not in the DataFrame'
+                             % foreign_key)
+            logger.error(error_message)
+            raise KeyError(error_message)
+
+    # Set the key, the foreign key attributes and the ltable and rtable in
+    # one catalog update.
+    return _catalog.update_properties(candset, {
+        'key': key,
+        'fk_ltable': foreign_key_ltable,
+        'fk_rtable': foreign_key_rtable,
+        'ltable': ltable,
+        'rtable': rtable})
 
 
 def _validate_metadata_for_table(table, key, output_string, lgr, verbose):
@@ -1165,7 +1237,7 @@ def _validate_metadata_for_table(table, key, output_string, lgr, verbose):
     """
     # Validate input parameters
     # # We expect the input table to be of type pandas DataFrame
-    validate_object_type(table, pd.DataFrame)
+    validate_object_type(table, _DF)
 
     # Check the key column is present in the table
     if not ch.check_attrs_present(table, key):
@@ -1175,7 +1247,7 @@ def _validate_metadata_for_table(table, key, output_string, lgr, verbose):
     ch.log_info(lgr, 'Validating ' + output_string + ' key: ' + str(key),
                 verbose)
     # We expect the key to be of type string
-    validate_object_type(key, six.string_types, error_prefix='Key attribute')
+    validate_object_type(key, str, error_prefix='Key attribute')
 
     if not ch.is_key_attribute(table, key, verbose):
         raise AssertionError('Attribute %s in the %s table does not '
@@ -1196,7 +1268,7 @@ def _validate_metadata_for_candset(candset, key, foreign_key_ltable,
     """
     # Validate input parameters
     # # We expect candset to be of type pandas DataFrame
-    validate_object_type(candset, pd.DataFrame, error_prefix='Input candset')
+    validate_object_type(candset, _DF, error_prefix='Input candset')
 
     # Check if the key column is present in the candset
     if not ch.check_attrs_present(candset, key):
@@ -1214,10 +1286,10 @@ def _validate_metadata_for_candset(candset, key, foreign_key_ltable,
             'Input fk_rtable ( %s ) not in the DataFrame' % foreign_key_rtable)
 
     # We expect the ltable to be of type pandas DataFrame
-    validate_object_type(ltable, pd.DataFrame, error_prefix='Input ltable')
+    validate_object_type(ltable, _DF, error_prefix='Input ltable')
 
     # We expect the rtable to be of type pandas DataFrame
-    validate_object_type(rtable, pd.DataFrame, error_prefix='Input rtable')
+    validate_object_type(rtable, _DF, error_prefix='Input rtable')
 
     # We expect the ltable key to be present in the ltable
     if not ch.check_attrs_present(ltable, ltable_key):
@@ -1259,12 +1331,12 @@ def get_keys_for_ltable_rtable(ltable, rtable, lgr, verbose):
     Gets keys for the ltable and rtable.
     """
     # We expect the ltable to be of type pandas DataFrame
-    if not isinstance(ltable, pd.DataFrame):
+    if not isinstance(ltable, _DF):
         logger.error('Input ltable is not of type pandas data frame')
         raise AssertionError('Input ltable is not of type pandas data frame')
 
     # We expect the rtable to be of type pandas DataFrame
-    if not isinstance(rtable, pd.DataFrame):
+    if not isinstance(rtable, _DF):
         logger.error('Input rtable is not of type pandas data frame')
         raise AssertionError('Input rtable is not of type pandas data frame')
 
@@ -1285,18 +1357,13 @@ def get_metadata_for_candset(candset, lgr, verbose):
 
     """
     # Validate input parameters
-    validate_object_type(candset, pd.DataFrame, error_prefix='Input candset')
+    validate_object_type(candset, _DF, error_prefix='Input candset')
 
     ch.log_info(lgr, 'Getting metadata from the catalog', verbose)
-    # Get the key, foreign keys, ltable, rtable and their keys
-    # # Get key
-    key = get_key(candset)
-    # # Get the foreign keys
-    fk_ltable = get_fk_ltable(candset)
-    fk_rtable = get_fk_rtable(candset)
-    # # Get the base tables
-    ltable = get_ltable(candset)
-    rtable = get_rtable(candset)
+    # Get the key, foreign keys, ltable, rtable (with a single look up of the
+    # candset in the catalog) and their keys
+    key, fk_ltable, fk_rtable, ltable, rtable = _get_properties_unchecked(
+        candset, ('key', 'fk_ltable', 'fk_rtable', 'ltable', 'rtable'))
     # Get the base table keys
     l_key = get_key(ltable)
     r_key = get_key(rtable)
@@ -52,8 +52,8 @@ def visualize_tree(decision_tree, table_columns, exclude_attrs=None):
     else:
         # Else pick out the feature vector columns based on the exclude
         # attributes.
-        columns = [c not in exclude_attrs for c in table_columns]
-        feature_names = table_columns[columns]
+        exclude_attrs = set(exclude_attrs)
+        feature_names = [c for c in table_columns if c not in exclude_attrs]
 
     # Create a file (as of now hardcoded) and write the tree into that file.
     with open("dt_.dot", 'w') as f:
@@ -206,10 +206,12 @@ def debug_decisiontree_matcher(decision_tree, tuple_1, tuple_2, feature_table,
 def _debug_decisiontree_matcher(decision_tree, tuple_1, tuple_2,
                                 feature_table, table_columns,
                                 exclude_attrs,
-                                ensemble_flag=False):
+                                ensemble_flag=False, feature_vectors=None):
     """
     This function is used to print the debug information for decision tree
-    and random forest matcher.
+    and random forest matcher. The feature vectors can be given if they were
+    already computed for the input tuples (e.g. once for all the trees in a
+    random forest).
     """
     # Get the classifier from the input object.
     if isinstance(decision_tree, DTMatcher):
@@ -221,14 +223,15 @@ def _debug_decisiontree_matcher(decision_tree, tuple_1, tuple_2,
     if exclude_attrs is None:
         feature_names = table_columns
     else:
-        cols = [c not in exclude_attrs for c in table_columns]
-        feature_names = table_columns[cols]
+        exclude_attrs = set(exclude_attrs)
+        feature_names = [c for c in table_columns if c not in exclude_attrs]
 
     # Get the python code based on the classifier, feature names and the
     # boolean results.
     code = _get_code(clf, feature_names, ['False', 'True'])
-    # Apply feature functions to get feature vectors.
-    feature_vectors = apply_feat_fns(tuple_1, tuple_2, feature_table)
+    # Apply feature functions to get feature vectors (if not given).
+    if feature_vectors is None:
+        feature_vectors = apply_feat_fns(tuple_1, tuple_2, feature_table)
 
     # Wrap the code in a a function
     code = _get_dbg_fn(code)
@@ -250,7 +253,8 @@ def _debug_decisiontree_matcher(decision_tree, tuple_1, tuple_2,
     # Further, if the ensemble flag is True, then print the prob. for match
     # and non-matches.
     if ensemble_flag is True:
-        p = _get_prob(clf, tuple_1, tuple_2, feature_table, feature_names)
+        p = _get_prob(clf, tuple_1, tuple_2, feature_table, feature_names,
+                      feature_vectors=feature_vectors)
         print(spacer + "Prob. for non-match : " + str(p[0]))
         print(spacer + "Prob for match : " + str(p[1]))
         return p
@@ -259,13 +263,16 @@ def _debug_decisiontree_matcher(decision_tree, tuple_1, tuple_2,
         print(spacer + "Match status : " + str(ret_val))
 
 
-def _get_prob(clf, t1, t2, feature_table, feature_names):
+def _get_prob(clf, t1, t2, feature_table, feature_names,
+              feature_vectors=None):
     """
     Get the probability of the match status.
     """
-    # Get the feature vectors from the feature table and the input tuples.
-    feat_values = apply_feat_fns(t1, t2, feature_table)
-    feat_values = pd.Series(feat_values)
+    # Get the feature vectors from the feature table and the input tuples
+    # (if not given).
+    if feature_vectors is None:
+        feature_vectors = apply_feat_fns(t1, t2, feature_table)
+    feat_values = pd.Series(feature_vectors)
     feat_values = feat_values[feature_names]
     v = feat_values.values
     v = v.reshape(1, -1)
@@ -7,6 +7,7 @@ import pandas as pd
 
 from py_entitymatching.debugmatcher.debug_decisiontree_matcher import \
     _debug_decisiontree_matcher, _get_prob
+from py_entitymatching.feature.extractfeatures import apply_feat_fns
 from py_entitymatching.matcher.rfmatcher import RFMatcher
 from py_entitymatching.utils.validation_helper import validate_object_type
 
@@ -69,11 +70,16 @@ def debug_randomforest_matcher(random_forest, tuple_1, tuple_2,
     if exclude_attrs is None:
         feature_names = table_columns
     else:
-        cols = [c not in exclude_attrs for c in table_columns]
-        feature_names = table_columns[cols]
+        exclude_attrs = set(exclude_attrs)
+        feature_names = [c for c in table_columns if c not in exclude_attrs]
+
+    # Apply the feature functions only once, the feature vectors are the same
+    # for all the trees in the forest.
+    feature_vectors = apply_feat_fns(tuple_1, tuple_2, feature_table)
 
     # Get the probability
-    prob = _get_prob(clf, tuple_1, tuple_2, feature_table, feature_names)
+    prob = _get_prob(clf, tuple_1, tuple_2, feature_table, feature_names,
+                     feature_vectors=feature_vectors)
 
     # Decide prediction based on the probability (i.e num. of trees that said
     #  match over total number of trees).
@@ -99,5 +105,6 @@ def debug_randomforest_matcher(random_forest, tuple_1, tuple_2,
                                         feature_table,
                                         table_columns,
                                         exclude_attrs,
-                                        ensemble_flag=True)
+                                        ensemble_flag=True,
+                                        feature_vectors=feature_vectors)
         print("")
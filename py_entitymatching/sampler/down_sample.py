@@ -12,7 +12,8 @@ import os
 import random
 import re
 import string
-from collections import Counter
+import weakref
+from functools import lru_cache
 
 import pandas as pd
 import numpy as np
@@ -37,14 +38,16 @@ def get_num_procs(n_jobs, min_procs):
     return min(n_procs, min_procs)
 
 
+# The stop words file does not change, so read it only once. The returned set
+# is frozen as it is shared between the callers.
+@lru_cache(maxsize=None)
 def _get_stop_words():
-    stop_words_set = set()
     install_path = get_install_path()
     dataset_path = os.sep.join([install_path, 'utils'])
     stop_words_file = os.sep.join([dataset_path, 'stop_words.txt'])
-    with open(stop_words_file, "rb") as stopwords_file:
-        for stop_words in stopwords_file:
-            stop_words_set.add(stop_words.rstrip())
+    with open(stop_words_file, "r", encoding="utf-8") as stopwords_file:
+        stop_words_set = frozenset(stop_words.rstrip()
+                                   for stop_words in stopwords_file)
 
     return stop_words_set
 
@@ -59,18 +62,17 @@ def _get_str_cols_list(table):
         logger.error(error_message)
         raise AssertionError(error_message)
 
-    cols = list(table.columns[table.dtypes == object])
-    col_list = []
-    for attr_x in cols:
-        col_list.append(table.columns.get_loc(attr_x))
-    return col_list
+    # Compare the dtypes directly to get the positions of the string columns,
+    # instead of going through the column names (which may not be unique)
+    return np.flatnonzero(table.dtypes.values == object).tolist()
 
 
-# create inverted index from token to position
-def _inv_index(table, rem_stop_words=True, rem_puncs=True):
+# tokenize the string columns of a table, one set of tokens per row
+def _tokenize_table(table, rem_stop_words=True, rem_puncs=True):
     """
 
-    This is inverted index function that builds inverted index of tokens on a table
+    This function tokenizes the string values of each row in a table and returns
+    the list of token sets, in the order of the rows
 
     """
 
@@ -79,44 +81,84 @@ def _inv_index(table, rem_stop_words=True, rem_puncs=True):
 
     # Extract indices of all string columns (if any) from the input DataFrame
     str_cols_ix = _get_str_cols_list(table)
+    if len(str_cols_ix) == 0:
+        return [set() for _ in range(len(table))]
+
+    # Lower case the string columns and concatenate them for each row, skipping
+    # the missing values. This is done column wise using the pandas string
+    # methods, instead of looping over the rows in Python.
+    str_cols = [table.iloc[:, col_ix].str.lower() for col_ix in str_cols_ix]
+    str_vals = str_cols[0].str.cat([col.values for col in str_cols[1:]],
+                                   sep=' ', na_rep='')
+    if rem_puncs:
+        str_vals = str_vals.str.replace(regex, '', regex=True)
+
+    # Tokenize the concatenated values and remove the stop words from the
+    # tokens of each row
+    if rem_stop_words:
+        return [set(tokens).difference(stop_words)
+                for tokens in str_vals.str.split().values]
+    return [set(tokens) for tokens in str_vals.str.split().values]
 
+
+# create inverted index from token to position
+def _inv_index(table, rem_stop_words=True, rem_puncs=True):
+    """
+
+    This is inverted index function that builds inverted index of tokens on a table
+
+    """
+
+    # Tokenize the string values for each row in the input table, then iterate
+    # through the tokens of each row to create an inverted index from the token
+    # to the positions of the rows that contain it.
     inv_index = dict()
-    pos = 0
-
-    # First project the input table to include only the string columns
-    proj_table = table[table.columns[str_cols_ix]]
-
-    # For each row in the DataFrame of the projected input table, we will fetch all
-    # string values from string column indices
-    # and will concatenate them. Next step would be to tokenize them using set and
-    # remove all the stop words from the list of tokens.
-    # Once we have the list of tokens, we will iterate through the list of tokens
-    # to identify its position and will create an inverted index.
-
-    for row in proj_table.itertuples(index=False):
-        # str_val = ''
-        # for list_item in str_cols_ix:
-        #     str_val += str(row[list_item]).lower() + ' '
-
-        str_val = ' '.join(col_val.lower().strip() for col_val in row[:] if not
-        pd.isnull(col_val))
-        if rem_puncs:
-            str_val = remove_punctuations(str_val)
-        str_val = str_val.rstrip()
-
-        # tokenize them
-        str_val = set(str_val.split())
-        if rem_stop_words:
-            str_val = str_val.difference(stop_words)
-
-        # building inverted index I from set of tokens
-        for token in str_val:
-            lst = inv_index.get(token, None)
-            if lst is None:
-                inv_index[token] = [pos]
-            else:
-                lst += [pos]
-        pos += 1
+    for pos, tokens in enumerate(_tokenize_table(table, rem_stop_words,
+                                                 rem_puncs)):
+        for token in tokens:
+            inv_index.setdefault(token, []).append(pos)
+
+    # Freeze the postings into integer arrays, so that probing can merge them
+    # in bulk instead of hashing the positions one by one
+    return {token: np.fromiter(positions, dtype=np.int32, count=len(positions))
+            for token, positions in inv_index.items()}
+
+
+# Inverted indexes built on the tables, keyed by the id of the table. The same
+# table is often down sampled several times (e.g. with different seeds or
+# sizes), so its index is reused as long as the string values it was built from
+# have not changed. An entry is dropped when its table is garbage collected.
+_inv_index_cache = {}
+
+
+def _get_inv_index(table, rem_stop_words=True, rem_puncs=True):
+    """
+
+    This function returns the inverted index of a table, reusing the cached one
+    if it was built from the same string values with the same options
+
+    """
+
+    # Hash the string values of each row, this is much cheaper than tokenizing
+    # them and tells if the table was modified since the index was built
+    str_cols_ix = _get_str_cols_list(table)
+    if len(str_cols_ix) > 0:
+        val_hashes = pd.util.hash_pandas_object(table.iloc[:, str_cols_ix],
+                                                index=False).values
+    else:
+        val_hashes = np.zeros(len(table), dtype=np.uint64)
+    options = (rem_stop_words, rem_puncs)
+
+    table_id = id(table)
+    cached = _inv_index_cache.get(table_id)
+    if cached is not None and cached[0] == options and \
+            np.array_equal(cached[1], val_hashes):
+        return cached[2]
+
+    inv_index = _inv_index(table, rem_stop_words, rem_puncs)
+    if cached is None:
+        weakref.finalize(table, _inv_index_cache.pop, table_id, None)
+    _inv_index_cache[table_id] = (options, val_hashes, inv_index)
     return inv_index
 
 
@@ -130,64 +172,42 @@ def _probe_index_split(table_b, y_param, s_tbl_sz, s_inv_index, show_progress=Tr
 
     y_pos = math.ceil(y_param / 2.0)
     h_table = set()
-    stop_words = _get_stop_words()
-    str_cols_ix = _get_str_cols_list(table_b)
+
+    # Tokenizing the string values and removing stop words before we start
+    # probing into inverted index I
+    token_sets = _tokenize_table(table_b, rem_stop_words, rem_puncs)
 
     # Progress Bar
     if show_progress:
         bar = pyprind.ProgBar(len(table_b))
 
-    proj_table_b = table_b[table_b.columns[str_cols_ix]]
     # For each tuple x ∈ B', we will probe inverted index I built in the previous step to find all tuples in A
     # (inverted index) that share tokens with x. We will rank these tuples in decreasing order of shared tokens, then
     # take (up to) the top k/2 tuples to be the set P.
 
-    for row in proj_table_b.itertuples(index=False):
-        id_freq_counter = Counter()  # keeps track of ids->frequency while probing inverted
-        # index.
+    for str_val in token_sets:
         if show_progress:
             bar.update()
 
-        # For all string column in the table, fetch all string values and concatenate them
-        # for list_ix in str_cols_ix:
-        #     str_val += str(row[list_ix]).lower() + ' '
-        str_val = ' '.join(col_val.lower().strip() for col_val in row[:] if not
-        pd.isnull(col_val))
-        if rem_puncs:
-            str_val = remove_punctuations(str_val)
-        str_val = str_val.rstrip()
-
-        # Tokenizing the string value and removing stop words before we start probing into inverted index I
-        str_val = set(str_val.split())
-        if rem_stop_words:
-            str_val = str_val.difference(stop_words)
-
         # For each token in the set, we will probe the token into inverted index I to get set of y/2 positive matches
-
-        for token in str_val:
-            ids = s_inv_index.get(token, None)
-            if ids is not None:
-                id_freq_counter.update(Counter(ids))
-
-
-                # ids_dict = {}
-                # for token in str_val:
-                #     ids = s_inv_index.get(token, None)
-                #     if ids is not None:
-                #         for id in ids:
-                #             if id not in ids_dict:
-                #                 ids_dict[id] = 1
-                #             else:
-                #                 ids_dict[id] = ids_dict[id] + 1
-
-                # match.update(ids)
-
-        # Pick y/2 elements from match
-        m = min(y_pos, len(id_freq_counter))
-        # match = list(match)
-
-        most_common_id_freqs = id_freq_counter.most_common(int(m))
-        smpl_pos_neg = set(key for key, val in most_common_id_freqs)
+        postings = [s_inv_index[token] for token in str_val
+                    if token in s_inv_index]
+
+        # Pick y/2 elements from match, the ones sharing the most tokens with
+        # x. Ties are broken by the position in A.
+        if postings:
+            ids, id_freqs = np.unique(np.concatenate(postings),
+                                      return_counts=True)
+            m = int(min(y_pos, len(ids)))
+            if m < len(ids):
+                # Only the top m are needed, so partition on a key that orders
+                # by decreasing count and then by increasing position, instead
+                # of sorting all the matches
+                rank_keys = np.arange(len(ids)) - id_freqs * len(ids)
+                ids = ids[np.argpartition(rank_keys, m - 1)[:m]]
+            smpl_pos_neg = set(ids.tolist())
+        else:
+            smpl_pos_neg = set()
 
         # num_pos = 0
         # sorted_key_values = [(k, v) for v, k in sorted(
@@ -204,11 +224,14 @@ def _probe_index_split(table_b, y_param, s_tbl_sz, s_inv_index, show_progress=Tr
         #     smpl_pos_neg.add(num)
 
         # Remaining y_param/2 items are selected here randomly. This is to get better coverage from both the input
-        # tables
+        # tables. Draw distinct positions in one go instead of retrying randint until enough new positions are
+        # found, and never ask for more positions than there are tuples in A.
         if seed is not None:
             random.seed(seed)
-        while len(smpl_pos_neg) < y_param:
-            rand_item_num = random.randint(0, s_tbl_sz - 1)
+        num_items = min(int(math.ceil(y_param)), s_tbl_sz)
+        for rand_item_num in random.sample(range(s_tbl_sz), num_items):
+            if len(smpl_pos_neg) >= num_items:
+                break
             smpl_pos_neg.add(rand_item_num)
         h_table.update(smpl_pos_neg)
 
@@ -332,7 +355,7 @@ def down_sample(table_a, table_b, size, y_param, show_progress=True,
 
     # Inverted index built on table A will consist of all tuples in such P's and Q's - central idea is to have
     # good coverage in the down sampled A' and B'.
-    s_inv_index = _inv_index(table_a, rem_stop_words, rem_puncs)
+    s_inv_index = _get_inv_index(table_a, rem_stop_words, rem_puncs)
 
     # Randomly select size tuples from table B to be B'
     # If a seed value has been give, use a RandomState with the given seed
@@ -341,11 +364,16 @@ def down_sample(table_a, table_b, size, y_param, show_progress=True,
         rand = RandomState(seed)
     else:
         rand = RandomState()
-    b_tbl_indices = list(rand.choice(len(table_b), int(b_sample_size), replace=False))
+    # Sort the sampled positions, so that the rows are gathered in table order
+    b_tbl_indices = np.sort(
+        rand.choice(len(table_b), int(b_sample_size), replace=False))
 
-    n_jobs = get_num_procs(n_jobs, len(table_b))
+    # Each job probes a split of B', so do not launch more jobs than there are
+    # tuples in B' (an empty split cannot be probed)
+    n_jobs = get_num_procs(n_jobs, len(b_tbl_indices))
 
-    sample_table_b = table_b.loc[b_tbl_indices]
+    # The sampled indices are positions, so select the rows with iloc
+    sample_table_b = table_b.iloc[b_tbl_indices]
     if n_jobs <= 1:
         # Probe inverted index to find all tuples in A that share tokens with tuples in B'.
         s_tbl_indices = _probe_index_split(sample_table_b, y_param,
@@ -360,12 +388,12 @@ def down_sample(table_a, table_b, size, y_param, show_progress=True,
                                        seed, rem_stop_words, rem_puncs)
             for job_index in range(n_jobs)
         )
-        results = map(list, results)
-        s_tbl_indices = set(sum(results, []))
+        s_tbl_indices = set().union(*results)
 
-    s_tbl_indices = list(s_tbl_indices)
-    l_sampled = table_a.iloc[list(s_tbl_indices)]
-    r_sampled = table_b.iloc[list(b_tbl_indices)]
+    s_tbl_indices = np.sort(np.fromiter(s_tbl_indices, dtype=np.int64,
+                                        count=len(s_tbl_indices)))
+    l_sampled = table_a.iloc[s_tbl_indices]
+    r_sampled = sample_table_b
 
     # update catalog
     if cm.is_dfinfo_present(table_a):
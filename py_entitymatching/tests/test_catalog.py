@@ -60,6 +60,12 @@ class CatalogManagerTestCases(unittest.TestCase):
         cm.get_property(A, 'key')
         # cm.del_catalog()
 
+    def test_get_property_none_value(self):
+        A = pd.read_csv(path_a)
+        cm.set_property(A, 'key', None)
+        self.assertEqual(cm.get_property(A, 'key'), None)
+        self.assertEqual(cm.is_property_present_for_df(A, 'key'), True)
+
     def test_set_property_valid_df_name_value(self):
         # cm.del_catalog()
         df = pd.read_csv(path_a)
@@ -67,6 +73,11 @@ class CatalogManagerTestCases(unittest.TestCase):
         self.assertEqual(cm.get_property(df, 'key'), 'ID')
         # cm.del_catalog()
 
+    def test_set_property_str_subclass_name(self):
+        df = pd.read_csv(path_a)
+        self.assertEqual(cm.set_property(df, np.str_('key'), 'ID'), True)
+        self.assertEqual(cm.get_property(df, 'key'), 'ID')
+
     @raises(AssertionError)
     def test_set_property_invalid_df(self):
         # cm.del_catalog()
@@ -232,6 +243,15 @@ class CatalogManagerTestCases(unittest.TestCase):
         A = read_csv_metadata(path_a)
         self.assertEqual(cm.get_catalog_len(), 1)
 
+    def test_catalog_entry_removed_on_gc(self):
+        import gc
+        A = pd.read_csv(path_a)
+        cm.set_key(A, 'ID')
+        self.assertEqual(cm.get_catalog_len(), 1)
+        del A
+        gc.collect()
+        self.assertEqual(cm.get_catalog_len(), 0)
+
     def test_set_properties_valid_1(self):
         A = read_csv_metadata(path_a)
         p = cm.get_all_properties(A)
@@ -247,6 +267,12 @@ class CatalogManagerTestCases(unittest.TestCase):
         cm.set_properties(B,p)
         self.assertEqual(cm.get_all_properties(B)==p, True)
 
+    def test_set_properties_replace_resets_properties(self):
+        A = read_csv_metadata(path_a)
+        cm.set_property(A, 'prop1', 'val1')
+        cm.set_properties(A, {'key': 'ID'})
+        self.assertEqual(cm.get_all_properties(A), {'key': 'ID'})
+
     @raises(AssertionError)
     def test_set_properties_invalid_df_1(self):
         cm.set_properties(None, {})
@@ -440,6 +466,26 @@ class CatalogManagerTestCases(unittest.TestCase):
         C = pd.read_csv(path_c)
         cm.set_fk_rtable(C, 'rtable_ID1')
 
+    def test_set_candset_properties_valid(self):
+        A = read_csv_metadata(path_a)
+        B = read_csv_metadata(path_b, key='ID')
+        C = pd.read_csv(path_c)
+        status = cm.set_candset_properties(C, '_id', 'ltable_ID', 'rtable_ID',
+                                           A, B)
+        self.assertEqual(status, True)
+        self.assertEqual(cm.get_key(C), '_id')
+        self.assertEqual(cm.get_fk_ltable(C), 'ltable_ID')
+        self.assertEqual(cm.get_fk_rtable(C), 'rtable_ID')
+        self.assertEqual(cm.get_ltable(C) is A, True)
+        self.assertEqual(cm.get_rtable(C) is B, True)
+
+    @raises(KeyError)
+    def test_set_candset_properties_fk_notin_df(self):
+        A = read_csv_metadata(path_a)
+        B = read_csv_metadata(path_b, key='ID')
+        C = pd.read_csv(path_c)
+        cm.set_candset_properties(C, '_id', 'ltable_ID', 'rtableID', A, B)
+
     def test_validate_and_set_fk_ltable_valid(self):
         A = read_csv_metadata(path_a)
         B = read_csv_metadata(path_b)
@@ -752,6 +798,19 @@ class CatalogManagerTestCases(unittest.TestCase):
     def test_get_metadata_for_candset_invalid_df(self):
         cm.get_metadata_for_candset(None, None, False)
 
+    @raises(KeyError)
+    def test_get_metadata_for_candset_df_notin_catalog(self):
+        C = pd.DataFrame({'_id': [0], 'ltable_ID': [1], 'rtable_ID': [1]})
+        cm.get_metadata_for_candset(C, None, False)
+
+    @raises(KeyError)
+    def test_get_metadata_for_candset_prop_notin_catalog(self):
+        A = read_csv_metadata(path_a)
+        B = read_csv_metadata(path_b, key='ID')
+        C = read_csv_metadata(path_c, ltable=A, rtable=B)
+        cm.del_property(C, 'fk_rtable')
+        cm.get_metadata_for_candset(C, None, False)
+
     #--- catalog ---
     def test_catalog_singleton_isinstance(self):
         from py_entitymatching.catalog.catalog import Singleton
@@ -911,6 +970,13 @@ class CatalogManagerTestCases(unittest.TestCase):
         status = ch.check_fk_constraint(C, 'ltable_ID', A, 'ID')
         self.assertEqual(status, False)
 
+    def test_check_fk_constraint_invalid_fk_val_notin_base(self):
+        A = pd.read_csv(path_a)
+        C = pd.read_csv(path_c)
+        C.loc[0, 'ltable_ID'] = 'a1000'
+        status = ch.check_fk_constraint(C, 'ltable_ID', A, 'ID')
+        self.assertEqual(status, False)
+
 
     def test_does_contain_rows_valid_1(self):
         A = pd.read_csv(path_a)
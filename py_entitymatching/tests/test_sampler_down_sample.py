@@ -1,4 +1,5 @@
 # coding=utf-8
+import gc
 import sys
 import py_entitymatching
 import os
@@ -9,6 +10,7 @@ import six
 
 from py_entitymatching.utils.generic_helper import get_install_path
 from py_entitymatching.sampler.down_sample import _inv_index, _probe_index_split, down_sample, _get_str_cols_list
+from py_entitymatching.sampler.down_sample import _get_inv_index, _inv_index_cache
 import py_entitymatching.catalog.catalog_manager as cm
 from py_entitymatching.io.parsers import read_csv_metadata
 
@@ -92,6 +94,18 @@ class DownSampleTestCases(unittest.TestCase):
         self.assertEqual(D.equals(F), True)
         self.assertEqual(C.equals(E), True)
 
+    def test_down_sample_non_default_index(self):
+        B = self.B.copy()
+        B.index = B.index + 1000
+        C, D = down_sample(self.A, B, 100, 10, seed=0, show_progress=False)
+        self.assertEqual(len(D), 100)
+        self.assertEqual(set(D.index).issubset(set(B.index)), True)
+
+    def test_down_sample_rows_in_table_order(self):
+        C, D = down_sample(self.A, self.B, 100, 10, seed=0, show_progress=False)
+        self.assertTrue(C.index.is_monotonic_increasing)
+        self.assertTrue(D.index.is_monotonic_increasing)
+
     # def test_down_sample_norm_njobs(self):
     #     C, D = down_sample(self.A, self.B, 100, 1, seed=0, n_jobs=1, show_progress=False)
     #     C = C.sort_values("ID")
@@ -114,6 +128,12 @@ class DownSampleTestCases(unittest.TestCase):
         C, D = down_sample(self.A, self.B, 100, 10, seed=0, n_jobs=-1,
                            show_progress=False)
 
+    def test_down_sample_njobs_gt_size(self):
+        C, D = down_sample(self.A, self.B, 2, 10, seed=0, n_jobs=4,
+                           show_progress=False)
+        self.assertEqual(len(D), 2)
+        assert(len(C) > 0)
+
 
 
 
@@ -134,6 +154,29 @@ class InvertedIndexTestCases(unittest.TestCase):
         inv_index = _inv_index(A)
         self.assertNotEqual(len(inv_index.get('beach')), 0)
 
+    def test_down_sample_get_inv_index_cached(self):
+        A = read_csv_metadata(path_a)
+        inv_index = _get_inv_index(A)
+        self.assertTrue(_get_inv_index(A) is inv_index)
+        self.assertFalse(_get_inv_index(A, rem_stop_words=False) is inv_index)
+
+    def test_down_sample_get_inv_index_table_modified(self):
+        A = read_csv_metadata(path_a)
+        inv_index = _get_inv_index(A)
+        self.assertFalse('zzyzx' in inv_index)
+        A.iloc[0, _get_str_cols_list(A)[0]] = 'zzyzx'
+        inv_index = _get_inv_index(A)
+        self.assertTrue('zzyzx' in inv_index)
+
+    def test_down_sample_get_inv_index_entry_removed_on_gc(self):
+        A = read_csv_metadata(path_a)
+        table_id = id(A)
+        _get_inv_index(A)
+        self.assertTrue(table_id in _inv_index_cache)
+        del A
+        gc.collect()
+        self.assertFalse(table_id in _inv_index_cache)
+
 
 class StrColTestCases(unittest.TestCase):
     @raises(AssertionError)
@@ -146,6 +189,11 @@ class StrColTestCases(unittest.TestCase):
         str_col_list = _get_str_cols_list(A)
         self.assertNotEqual(len(str_col_list), 0)
 
+    def test_down_sample_get_str_cols_list_dup_col_names(self):
+        A = pd.DataFrame([['a', 1, 'b']], columns=['x', 'y', 'x'])
+        str_col_list = _get_str_cols_list(A)
+        self.assertEqual(str_col_list, [0, 2])
+
 
 class ProbeIndexTestCases(unittest.TestCase):
     def test_down_sample_probe_index_invalid_set(self):
@@ -161,3 +209,20 @@ class ProbeIndexTestCases(unittest.TestCase):
         in_index = _inv_index(A)
         s_tbl_indices = _probe_index_split(B, 5, len(A), in_index)
         self.assertNotEqual(len(s_tbl_indices), 0)
+
+    def test_down_sample_probe_index_y_param_gt_table_size(self):
+        A = read_csv_metadata(path_a)
+        B = read_csv_metadata(path_b, key='ID')
+        A = A.head(3)
+        in_index = _inv_index(A)
+        s_tbl_indices = _probe_index_split(B.head(5), 10, len(A), in_index,
+                                           show_progress=False)
+        self.assertEqual(s_tbl_indices, {0, 1, 2})
+
+    def test_down_sample_probe_index_most_shared_tokens(self):
+        A = pd.DataFrame({'name': ['alpha beta gamma', 'alpha', 'delta']})
+        B = pd.DataFrame({'name': ['alpha beta gamma']})
+        in_index = _inv_index(A)
+        s_tbl_indices = _probe_index_split(B, 1, len(A), in_index,
+                                           show_progress=False)
+        self.assertEqual(s_tbl_indices, {0})
@@ -30,9 +30,10 @@ def are_all_attrs_in_df(df, col_names, verbose=False):
         logger.warning('Input col_names is null')
         return False
 
-    df_columns_names = list(df.columns)
+    # Check against the columns Index directly, it looks the names up in its
+    # cached hash table instead of building a new container on every call
     for c in col_names:
-        if c not in df_columns_names:
+        if c not in df.columns:
             if verbose:
                 logger.warning('Column name (' +c+ ') is not present in dataframe')
             return False
@@ -88,7 +89,7 @@ def does_contain_missing_vals(df, attr):
     validate_object_type(attr, six.string_types, error_prefix='Input attr.')
 
     # nan_flag = (sum(df[attr].isnull()) != 0)
-    nan_flag = any(pd.isnull(df[attr]))
+    nan_flag = df[attr].isnull().values.any()
     if not nan_flag:
         return False
     else:
@@ -113,8 +114,9 @@ def is_key_attribute(df, attr, verbose=False):
 
     # check if the length is > 0
     if len(df) > 0:
+        col = df[attr]
         # check for uniqueness
-        uniq_flag = len(pd.unique(df[attr])) == len(df)
+        uniq_flag = col.is_unique
         if not uniq_flag:
             if verbose:
                 logger.warning('Attribute ' + attr + ' does not contain unique values')
@@ -122,7 +124,7 @@ def is_key_attribute(df, attr, verbose=False):
 
         # check if there are missing or null values
         # nan_flag = sum(df[attr].isnull()) == 0
-        nan_flag = not any(pd.isnull(df[attr]))
+        nan_flag = not col.isnull().values.any()
         if not nan_flag:
             if verbose:
                 logger.warning('Attribute ' + attr + ' contains missing values')
@@ -161,20 +163,22 @@ def check_fk_constraint(df_foreign, attr_foreign, df_base, attr_base):
         logger.error('Input attr (attr_foreign) is not in df_foreign')
         return False
 
-    if any(pd.isnull(df_foreign[attr_foreign])):
+    # All the checks below are done with vectorized pandas operations, as
+    # the foreign table is typically a large candidate set.
+    fk_vals = df_foreign[attr_foreign]
+    if fk_vals.isnull().values.any():
         logger.warning('The attribute %s in foreign table contains null values' %attr_foreign)
         return False
 
-    uniq_fk_vals = set(pd.unique(df_foreign[attr_foreign]))
-    base_attr_vals = df_base[attr_base].values
-    d = uniq_fk_vals.difference(base_attr_vals)
-    if len(d) > 0:
+    uniq_fk_vals = pd.unique(fk_vals)
+    base_attr_vals = df_base[attr_base]
+    if not pd.Series(uniq_fk_vals).isin(base_attr_vals.values).all():
         logger.warning('For some attr. values in (%s) in the foreign table there are no values in '
                        '(%s) in the base table' %(attr_foreign, attr_base))
         return False
 
     # check whether those values are unique in the base table.
-    t = df_base[df_base[attr_base].isin(pd.unique(df_foreign[attr_foreign]))]
+    t = df_base[base_attr_vals.isin(uniq_fk_vals)]
     status = is_key_attribute(t, attr_base)
 
     if status == False: